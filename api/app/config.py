@@ -1,21 +1,28 @@
 """
-Application configuration using pydantic-settings.
-Environment variables are loaded automatically.
+Application configuration.
+Environment variables are read once, matched to fields case-insensitively.
+For local development, load a .env file with `uvicorn --env-file .env`.
 """
 
+import os
 from functools import lru_cache
 
-from pydantic_settings import BaseSettings
+from pydantic import BaseModel, ConfigDict
 
 
-class Settings(BaseSettings):
+class Settings(BaseModel):
     """Application settings loaded from environment variables."""
 
+    model_config = ConfigDict(frozen=True)
+
     # Application
     app_name: str = "PostgreSQL HA/DR Demo API"
     app_version: str = "1.0.0"
     debug: bool = False
 
+    # Health checks
+    readiness_cache_ttl: float = 1.0  # Seconds a successful /ready check is reused
+
     # Database
     db_host: str = "localhost"
     db_port: int = 5432
@@ -23,18 +30,23 @@ class Settings(BaseSettings):
     db_user: str = "postgres"
     db_password: str = ""
     db_pool_min_size: int = 5
-    db_pool_max_size: int = 20
+    db_pool_max_size: int = 50
+    db_pool_max_inactive_lifetime: float = 300.0  # Seconds before idle connections are closed
+    db_statement_cache_size: int = 1024  # Prepared statements cached per connection
+    db_application_name: str = "pgha-demo-api"
 
     # pgBackRest (for backup status endpoint)
     pgbackrest_stanza: str = "pgha-dev-postgres"
+    pgbackrest_cache_ttl: float = 30.0  # Seconds to reuse `pgbackrest info` output
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from environment variables named after the fields."""
+        env = {key.lower(): value for key, value in os.environ.items()}
+        return cls.model_validate({name: env[name] for name in cls.model_fields if name in env})
 
 
 @lru_cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
+    return Settings.from_env()
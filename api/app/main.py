@@ -8,25 +8,33 @@ and backup status monitoring for a PostgreSQL HA cluster.
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 
 from .config import get_settings
 from .db import close_pool, get_pool
+from .middleware import FastPathCORSMiddleware
 from .routers import backups_router, health_router, items_router, metrics_router
+from .routers.items import ensure_table_exists
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup/shutdown events.
-    Initializes database pool on startup and closes on shutdown.
+    Initializes database pool and items table on startup and closes the
+    pool on shutdown.
     """
-    # Startup: Initialize database connection pool
+    # Startup: Initialize database connection pool and items table
     try:
-        await get_pool()
+        pool = await get_pool()
         print("Database connection pool initialized")
     except Exception as e:
         print(f"Warning: Failed to initialize database pool: {e}")
+    else:
+        try:
+            async with pool.acquire() as conn:
+                await ensure_table_exists(conn)
+        except Exception as e:
+            print(f"Warning: Failed to create items table: {e}")
 
     yield
 
@@ -65,9 +73,9 @@ cluster with Disaster Recovery capabilities.
         lifespan=lifespan,
     )
 
-    # CORS middleware
+    # CORS middleware (requests without an Origin header bypass it)
     app.add_middleware(
-        CORSMiddleware,
+        FastPathCORSMiddleware,
         allow_origins=["*"],  # Configure appropriately for production
         allow_credentials=True,
         allow_methods=["*"],
@@ -0,0 +1,26 @@
+"""
+ASGI middleware.
+"""
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import Receive, Scope, Send
+
+
+class FastPathCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware that passes requests without an Origin header straight through.
+    Health probes and server-to-server calls never send Origin, so they skip
+    the Headers parsing done by the parent class.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            # ASGI header names are lowercase bytes
+            for name, _ in scope["headers"]:
+                if name == b"origin":
+                    break
+            else:
+                await self.app(scope, receive, send)
+                return
+
+        await super().__call__(scope, receive, send)
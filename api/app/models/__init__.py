@@ -4,6 +4,7 @@ from .schemas import (
     BackupResponse,
     HealthResponse,
     Item,
+    ItemBulkCreateResponse,
     ItemCreate,
     ItemUpdate,
     MetricsResponse,
@@ -14,6 +15,7 @@ from .schemas import (
 __all__ = [
     "Item",
     "ItemCreate",
+    "ItemBulkCreateResponse",
     "ItemUpdate",
     "HealthResponse",
     "ReadyResponse",
@@ -1,10 +1,15 @@
 """
 Pydantic models for request/response schemas.
+Response models are frozen: they are built once per request from trusted
+data and never mutated afterwards (use model_copy(update=...) instead).
 """
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared config for response models
+RESPONSE_CONFIG = ConfigDict(frozen=True)
 
 # =============================================================================
 # Item CRUD Models
@@ -33,12 +38,18 @@ class ItemUpdate(BaseModel):
 
 class Item(ItemBase):
     """Complete item model with database fields."""
+    model_config = RESPONSE_CONFIG
+
     id: int
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+
+class ItemBulkCreateResponse(BaseModel):
+    """Result of a bulk item insert."""
+    model_config = RESPONSE_CONFIG
+
+    inserted: int
 
 
 # =============================================================================
@@ -47,6 +58,8 @@ class Item(ItemBase):
 
 class HealthResponse(BaseModel):
     """Health check response."""
+    model_config = RESPONSE_CONFIG
+
     status: str = "healthy"
     version: str
     timestamp: datetime
@@ -54,6 +67,8 @@ class HealthResponse(BaseModel):
 
 class ReadyResponse(BaseModel):
     """Readiness check response with component status."""
+    model_config = RESPONSE_CONFIG
+
     status: str
     database: str
     timestamp: datetime
@@ -65,6 +80,8 @@ class ReadyResponse(BaseModel):
 
 class MetricsResponse(BaseModel):
     """Database metrics response."""
+    model_config = RESPONSE_CONFIG
+
     database_size_bytes: int
     active_connections: int
     max_connections: int
@@ -85,6 +102,8 @@ class MetricsResponse(BaseModel):
 
 class BackupInfo(BaseModel):
     """Individual backup information."""
+    model_config = RESPONSE_CONFIG
+
     label: str
     type: str  # full, diff, incr
     start_time: datetime | None = None
@@ -95,12 +114,16 @@ class BackupInfo(BaseModel):
 
 class WALArchiveInfo(BaseModel):
     """WAL archive information."""
+    model_config = RESPONSE_CONFIG
+
     min_wal: str | None = None
     max_wal: str | None = None
 
 
 class BackupResponse(BaseModel):
     """Complete backup status response."""
+    model_config = RESPONSE_CONFIG
+
     stanza: str
     status: str
     status_message: str | None = None
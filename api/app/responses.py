@@ -0,0 +1,31 @@
+"""
+Pre-encoded JSON responses.
+Serializers are compiled once per response type and reused across requests.
+"""
+
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+# Compiled serializers keyed by response type (e.g. Item, list[Item])
+_adapters: dict[Any, TypeAdapter[Any]] = {}
+
+
+def json_response(response_type: Any, content: Any, status_code: int = 200) -> Response:
+    """
+    Serialize content with the cached serializer for response_type.
+
+    Returning a Response directly skips FastAPI's per-request response_model
+    validation and jsonable_encoder pass; the route's response_model is still
+    used for the OpenAPI schema.
+    """
+    adapter = _adapters.get(response_type)
+    if adapter is None:
+        adapter = _adapters[response_type] = TypeAdapter(response_type)
+
+    return Response(
+        content=adapter.dump_json(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
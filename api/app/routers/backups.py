@@ -3,58 +3,55 @@ Backup status endpoint.
 Queries pgBackRest for backup information.
 """
 
-import json
-import subprocess
+import asyncio
+import time
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Response
 
 from ..config import get_settings
 from ..models import BackupInfo, BackupResponse, WALArchiveInfo
+from ..responses import json_response
 
 router = APIRouter(tags=["Backups"])
 
+# Last pgBackRest result as (monotonic time, response), reused for the TTL
+_cache: tuple[float, BackupResponse] | None = None
+_cache_lock = asyncio.Lock()
 
-def parse_pgbackrest_timestamp(ts: int | None) -> datetime | None:
-    """Convert pgBackRest Unix timestamp to datetime."""
-    if ts is None:
-        return None
-    return datetime.fromtimestamp(ts, tz=UTC)
 
-
-@router.get("/backups", response_model=BackupResponse)
-async def get_backup_status() -> BackupResponse:
-    """
-    Get pgBackRest backup status.
-    Returns information about all backups and WAL archiving status.
-
-    Note: This endpoint requires pgBackRest to be installed and configured
-    on the system where the API is running.
-    """
-    settings = get_settings()
-    stanza = settings.pgbackrest_stanza
+async def collect_backup_status(stanza: str) -> BackupResponse:
+    """Run `pgbackrest info` for the stanza and build the status response."""
+    now = datetime.now(UTC)
 
     try:
-        # Run pgbackrest info command
-        result = subprocess.run(
-            ["pgbackrest", "--stanza", stanza, "info", "--output=json"],
-            capture_output=True,
-            text=True,
-            timeout=30,
+        # Run pgbackrest info command without blocking the event loop
+        proc = await asyncio.create_subprocess_exec(
+            "pgbackrest", "--stanza", stanza, "info", "--output=json",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-
-        if result.returncode != 0:
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+
+        if proc.returncode != 0:
             # pgBackRest not available or stanza not configured
+            error = stderr.decode(errors="replace").strip()
             return BackupResponse(
                 stanza=stanza,
                 status="unavailable",
-                status_message=f"pgBackRest error: {result.stderr.strip() or 'Unknown error'}",
+                status_message=f"pgBackRest error: {error or 'Unknown error'}",
                 backups=[],
-                timestamp=datetime.now(UTC),
+                timestamp=now,
             )
 
         # Parse JSON output
-        info = json.loads(result.stdout)
+        info = orjson.loads(stdout)
 
         if not info:
             return BackupResponse(
@@ -62,7 +59,7 @@ async def get_backup_status() -> BackupResponse:
                 status="no_stanza",
                 status_message="No stanza information available",
                 backups=[],
-                timestamp=datetime.now(UTC),
+                timestamp=now,
             )
 
         stanza_info = info[0]
@@ -79,40 +76,49 @@ async def get_backup_status() -> BackupResponse:
         else:
             status = "error"
 
-        # Parse backups
+        # Parse backups. pgBackRest output is trusted, so models are built
+        # without validation.
         backups: list[BackupInfo] = []
         last_full: datetime | None = None
         last_diff: datetime | None = None
+        # Bound once outside the loop; pgBackRest timestamps are Unix seconds
+        fromtimestamp = datetime.fromtimestamp
 
         for backup in stanza_info.get("backup", []):
-            backup_info = BackupInfo(
+            backup_type = backup.get("type", "unknown")
+            timestamps = backup.get("timestamp", {})
+            start = timestamps.get("start")
+            stop = timestamps.get("stop")
+            stop_time = fromtimestamp(stop, UTC) if stop is not None else None
+            details = backup.get("info", {})
+
+            backups.append(BackupInfo.model_construct(
                 label=backup.get("label", "unknown"),
-                type=backup.get("type", "unknown"),
-                start_time=parse_pgbackrest_timestamp(backup.get("timestamp", {}).get("start")),
-                stop_time=parse_pgbackrest_timestamp(backup.get("timestamp", {}).get("stop")),
-                size_bytes=backup.get("info", {}).get("size"),
-                database_size_bytes=backup.get("info", {}).get("repository", {}).get("size"),
-            )
-            backups.append(backup_info)
+                type=backup_type,
+                start_time=fromtimestamp(start, UTC) if start is not None else None,
+                stop_time=stop_time,
+                size_bytes=details.get("size"),
+                database_size_bytes=details.get("repository", {}).get("size"),
+            ))
 
             # Track latest backups by type
-            if backup_info.type == "full" and backup_info.stop_time:
-                if last_full is None or backup_info.stop_time > last_full:
-                    last_full = backup_info.stop_time
-            elif backup_info.type == "diff" and backup_info.stop_time:
-                if last_diff is None or backup_info.stop_time > last_diff:
-                    last_diff = backup_info.stop_time
+            if backup_type == "full" and stop_time:
+                if last_full is None or stop_time > last_full:
+                    last_full = stop_time
+            elif backup_type == "diff" and stop_time:
+                if last_diff is None or stop_time > last_diff:
+                    last_diff = stop_time
 
         # Parse WAL archive info
         wal_archive = None
         archive_info = stanza_info.get("archive", [])
         if archive_info:
-            wal_archive = WALArchiveInfo(
+            wal_archive = WALArchiveInfo.model_construct(
                 min_wal=archive_info[0].get("min"),
                 max_wal=archive_info[0].get("max"),
             )
 
-        return BackupResponse(
+        return BackupResponse.model_construct(
             stanza=stanza,
             status=status,
             status_message=status_message if status != "ok" else None,
@@ -120,16 +126,16 @@ async def get_backup_status() -> BackupResponse:
             wal_archive=wal_archive,
             last_full_backup=last_full,
             last_diff_backup=last_diff,
-            timestamp=datetime.now(UTC),
+            timestamp=now,
         )
 
-    except subprocess.TimeoutExpired:
+    except TimeoutError:
         return BackupResponse(
             stanza=stanza,
             status="timeout",
             status_message="pgBackRest command timed out",
             backups=[],
-            timestamp=datetime.now(UTC),
+            timestamp=now,
         )
     except FileNotFoundError:
         return BackupResponse(
@@ -137,18 +143,54 @@ async def get_backup_status() -> BackupResponse:
             status="not_installed",
             status_message="pgBackRest is not installed on this system",
             backups=[],
-            timestamp=datetime.now(UTC),
+            timestamp=now,
         )
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         return BackupResponse(
             stanza=stanza,
             status="parse_error",
             status_message=f"Failed to parse pgBackRest output: {str(e)}",
             backups=[],
-            timestamp=datetime.now(UTC),
+            timestamp=now,
         )
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to get backup status: {str(e)}"
         )
+
+
+async def get_cached_backup_status(stanza: str, ttl: float) -> BackupResponse:
+    """
+    Get backup status, running pgBackRest at most once per TTL window.
+    Concurrent requests during a refresh wait for the single in-flight call.
+    """
+    global _cache
+
+    cached = _cache
+    if cached is None or time.monotonic() - cached[0] >= ttl:
+        async with _cache_lock:
+            cached = _cache
+            if cached is None or time.monotonic() - cached[0] >= ttl:
+                response = await collect_backup_status(stanza)
+                _cache = (time.monotonic(), response)
+                return response
+
+    return cached[1].model_copy(update={"timestamp": datetime.now(UTC)})
+
+
+@router.get("/backups", response_model=BackupResponse)
+async def get_backup_status() -> Response:
+    """
+    Get pgBackRest backup status.
+    Returns information about all backups and WAL archiving status.
+    Results are cached for PGBACKREST_CACHE_TTL seconds.
+
+    Note: This endpoint requires pgBackRest to be installed and configured
+    on the system where the API is running.
+    """
+    settings = get_settings()
+    status = await get_cached_backup_status(
+        settings.pgbackrest_stanza, settings.pgbackrest_cache_ttl
+    )
+    return json_response(BackupResponse, status)
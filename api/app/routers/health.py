@@ -4,64 +4,129 @@ Health check endpoints.
 - /ready - Readiness check with database connectivity
 """
 
+import asyncio
+import time
 from datetime import UTC, datetime
+from functools import lru_cache
 
-from fastapi import APIRouter, HTTPException
+import asyncpg
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from ..config import get_settings
 from ..db import get_pool
 from ..models import HealthResponse, ReadyResponse
+from ..responses import json_response
 
 router = APIRouter(tags=["Health"])
 
+# Last database check as (monotonic time, status); "connected" is reused for the TTL
+_ready_cache: tuple[float, str] | None = None
+_ready_lock = asyncio.Lock()
+
+
+@lru_cache
+def _health_prefix() -> bytes:
+    """Liveness body up to the timestamp value, with the version baked in."""
+    version = orjson.dumps(get_settings().app_version)
+    return b'{"status":"healthy","version":' + version + b',"timestamp":"'
+
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """
     Basic health check endpoint.
     Returns 200 if the service is running.
+    Probes hit this constantly, so the body is assembled from a prebuilt
+    prefix instead of building and serializing a HealthResponse.
     """
-    settings = get_settings()
-    return HealthResponse(
-        status="healthy",
-        version=settings.app_version,
-        timestamp=datetime.now(UTC),
+    timestamp = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+    return Response(
+        content=_health_prefix() + timestamp.encode() + b'"}',
+        media_type="application/json",
     )
 
 
-@router.get("/ready", response_model=ReadyResponse)
-async def readiness_check() -> ReadyResponse:
+def _not_ready(db_status: str, now: datetime) -> HTTPException:
+    """Build the 503 raised when the database is not usable."""
+    return HTTPException(
+        status_code=503,
+        detail=ReadyResponse(
+            status="not_ready",
+            database=db_status,
+            timestamp=now,
+        ).model_dump(mode="json"),
+    )
+
+
+async def database_pool() -> asyncpg.Pool:
     """
-    Readiness check endpoint.
-    Verifies database connectivity before returning healthy.
+    Dependency providing the connection pool to the readiness check.
+    Responds 503 straight away if the pool cannot be created.
     """
-    db_status = "unknown"
+    try:
+        return await get_pool()
+    except Exception as e:
+        raise _not_ready(f"error: {str(e)}", datetime.now(UTC)) from e
 
+
+async def check_database(pool: asyncpg.Pool) -> str:
+    """Run a trivial query and describe the database status."""
     try:
-        pool = await get_pool()
         async with pool.acquire() as conn:
             result = await conn.fetchval("SELECT 1")
             if result == 1:
-                db_status = "connected"
-            else:
-                db_status = "error"
+                return "connected"
+            return "error"
     except Exception as e:
-        db_status = f"error: {str(e)}"
-
-    overall_status = "ready" if db_status == "connected" else "not_ready"
-
-    if overall_status == "not_ready":
-        raise HTTPException(
-            status_code=503,
-            detail=ReadyResponse(
-                status=overall_status,
-                database=db_status,
-                timestamp=datetime.now(UTC),
-            ).model_dump(),
-        )
-
-    return ReadyResponse(
-        status=overall_status,
-        database=db_status,
-        timestamp=datetime.now(UTC),
+        return f"error: {str(e)}"
+
+
+async def get_database_status(pool: asyncpg.Pool, ttl: float) -> str:
+    """
+    Get the database status, reusing a successful check for ttl seconds.
+    Probes that arrive during a check wait for it and share its result;
+    failures are not cached, so the next probe checks again.
+    """
+    global _ready_cache
+
+    requested_at = time.monotonic()
+    cached = _ready_cache
+    if cached is not None and cached[1] == "connected" and requested_at - cached[0] < ttl:
+        return cached[1]
+
+    async with _ready_lock:
+        # Another probe may have completed a check while this one waited
+        cached = _ready_cache
+        if cached is not None and cached[0] >= requested_at:
+            return cached[1]
+
+        db_status = await check_database(pool)
+        _ready_cache = (time.monotonic(), db_status)
+
+    return db_status
+
+
+@router.get("/ready", response_model=ReadyResponse)
+async def readiness_check(pool: asyncpg.Pool = Depends(database_pool)) -> Response:
+    """
+    Readiness check endpoint.
+    Verifies database connectivity before returning healthy.
+    A successful check is reused for READINESS_CACHE_TTL seconds so probe
+    bursts don't compete with requests for pool connections.
+    """
+    settings = get_settings()
+    db_status = await get_database_status(pool, settings.readiness_cache_ttl)
+    now = datetime.now(UTC)
+
+    if db_status != "connected":
+        raise _not_ready(db_status, now)
+
+    return json_response(
+        ReadyResponse,
+        ReadyResponse(
+            status="ready",
+            database=db_status,
+            timestamp=now,
+        ),
     )
@@ -4,10 +4,12 @@ Items CRUD endpoints - Demo resource for testing database operations.
 
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, HTTPException, Query
+import asyncpg
+from fastapi import APIRouter, Body, HTTPException, Query, Response
 
 from ..db import get_connection
-from ..models import Item, ItemCreate, ItemUpdate
+from ..models import Item, ItemBulkCreateResponse, ItemCreate, ItemUpdate
+from ..responses import json_response
 
 router = APIRouter(prefix="/items", tags=["Items"])
 
@@ -16,24 +18,103 @@ router = APIRouter(prefix="/items", tags=["Items"])
 # Ensure table exists
 # =============================================================================
 
-async def ensure_table_exists() -> None:
-    """Create items table if it doesn't exist."""
-    async with get_connection() as conn:
-        await conn.execute("""
-            CREATE TABLE IF NOT EXISTS items (
-                id SERIAL PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                description TEXT,
-                price DECIMAL(10, 2) NOT NULL,
-                is_active BOOLEAN DEFAULT TRUE,
-                created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-                updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-            )
-        """)
-        # Create index for common queries
-        await conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_items_is_active ON items(is_active)
-        """)
+# Set once the table has been created; checked before touching the database
+_table_ready = False
+
+
+async def ensure_table_exists(conn: asyncpg.Connection) -> None:
+    """
+    Create items table if it doesn't exist.
+    Runs at startup; handlers call it with their own connection as a cheap
+    fallback in case the database was unreachable when the application started.
+    """
+    global _table_ready
+
+    if _table_ready:
+        return
+
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS items (
+            id SERIAL PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            description TEXT,
+            price DECIMAL(10, 2) NOT NULL,
+            is_active BOOLEAN DEFAULT TRUE,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+            updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+        )
+    """)
+    # Create index for common queries
+    await conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_items_is_active ON items(is_active)
+    """)
+
+    _table_ready = True
+
+
+# =============================================================================
+# Queries
+# =============================================================================
+# Kept as constants so every call sends identical SQL text and hits asyncpg's
+# per-connection prepared statement cache.
+
+INSERT_ITEM_QUERY = """
+    INSERT INTO items (name, description, price, is_active, created_at, updated_at)
+    VALUES ($1, $2, $3, $4, $5, $5)
+    RETURNING id, name, description, price::float8 AS price, is_active, created_at, updated_at
+"""
+
+# active_only is a parameter rather than a second query, so both variants
+# share one prepared statement
+LIST_ITEMS_QUERY = """
+    SELECT id, name, description, price::float8 AS price, is_active, created_at, updated_at
+    FROM items
+    WHERE ($3::bool IS FALSE OR is_active = TRUE)
+    ORDER BY id
+    OFFSET $1 LIMIT $2
+"""
+
+GET_ITEM_QUERY = """
+    SELECT id, name, description, price::float8 AS price, is_active, created_at, updated_at
+    FROM items
+    WHERE id = $1
+"""
+
+# NULL parameters keep the current column value, so a single statement covers
+# every combination of updated fields
+UPDATE_ITEM_QUERY = """
+    UPDATE items
+    SET name = COALESCE($1, name),
+        description = COALESCE($2, description),
+        price = COALESCE($3, price),
+        is_active = COALESCE($4, is_active),
+        updated_at = $5
+    WHERE id = $6
+    RETURNING id, name, description, price::float8 AS price, is_active, created_at, updated_at
+"""
+
+
+# =============================================================================
+# Row conversion
+# =============================================================================
+
+def _item_from_row(row: asyncpg.Record) -> Item:
+    """
+    Build an Item from a row without validation.
+    Rows are trusted and already match the schema (price is cast to float8 in
+    SQL because DECIMAL columns come back as Decimal). Columns are read by
+    position, in the order every query here selects them: id, name,
+    description, price, is_active, created_at, updated_at.
+    """
+    return Item.model_construct(
+        id=row[0],
+        name=row[1],
+        description=row[2],
+        price=row[3],
+        is_active=row[4],
+        created_at=row[5],
+        updated_at=row[6],
+    )
 
 
 # =============================================================================
@@ -41,17 +122,12 @@ async def ensure_table_exists() -> None:
 # =============================================================================
 
 @router.post("", response_model=Item, status_code=201)
-async def create_item(item: ItemCreate) -> Item:
+async def create_item(item: ItemCreate) -> Response:
     """Create a new item."""
-    await ensure_table_exists()
-
     async with get_connection() as conn:
+        await ensure_table_exists(conn)
         row = await conn.fetchrow(
-            """
-            INSERT INTO items (name, description, price, is_active, created_at, updated_at)
-            VALUES ($1, $2, $3, $4, $5, $5)
-            RETURNING id, name, description, price, is_active, created_at, updated_at
-            """,
+            INSERT_ITEM_QUERY,
             item.name,
             item.description,
             item.price,
@@ -59,7 +135,37 @@ async def create_item(item: ItemCreate) -> Item:
             datetime.now(UTC),
         )
 
-    return Item(**dict(row))
+    return json_response(Item, _item_from_row(row), status_code=201)
+
+
+@router.post("/bulk", response_model=ItemBulkCreateResponse, status_code=201)
+async def create_items_bulk(
+    items: list[ItemCreate] = Body(..., min_length=1, max_length=10000),
+) -> Response:
+    """
+    Create many items at once.
+    Rows are sent with the binary COPY protocol, avoiding a parse/plan and
+    round-trip per row.
+    """
+    now = datetime.now(UTC)
+    records = [
+        (item.name, item.description, item.price, item.is_active, now, now)
+        for item in items
+    ]
+
+    async with get_connection() as conn:
+        await ensure_table_exists(conn)
+        await conn.copy_records_to_table(
+            "items",
+            records=records,
+            columns=("name", "description", "price", "is_active", "created_at", "updated_at"),
+        )
+
+    return json_response(
+        ItemBulkCreateResponse,
+        ItemBulkCreateResponse(inserted=len(records)),
+        status_code=201,
+    )
 
 
 @router.get("", response_model=list[Item])
@@ -67,120 +173,62 @@ async def list_items(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     active_only: bool = Query(False),
-) -> list[Item]:
+) -> Response:
     """List all items with pagination."""
-    await ensure_table_exists()
-
     async with get_connection() as conn:
-        if active_only:
-            rows = await conn.fetch(
-                """
-                SELECT id, name, description, price, is_active, created_at, updated_at
-                FROM items
-                WHERE is_active = TRUE
-                ORDER BY id
-                OFFSET $1 LIMIT $2
-                """,
-                skip,
-                limit,
-            )
-        else:
-            rows = await conn.fetch(
-                """
-                SELECT id, name, description, price, is_active, created_at, updated_at
-                FROM items
-                ORDER BY id
-                OFFSET $1 LIMIT $2
-                """,
-                skip,
-                limit,
-            )
-
-    return [Item(**dict(row)) for row in rows]
+        await ensure_table_exists(conn)
+        rows = await conn.fetch(LIST_ITEMS_QUERY, skip, limit, active_only)
+
+    return json_response(list[Item], [_item_from_row(row) for row in rows])
 
 
 @router.get("/{item_id}", response_model=Item)
-async def get_item(item_id: int) -> Item:
+async def get_item(item_id: int) -> Response:
     """Get a specific item by ID."""
-    await ensure_table_exists()
-
     async with get_connection() as conn:
-        row = await conn.fetchrow(
-            """
-            SELECT id, name, description, price, is_active, created_at, updated_at
-            FROM items
-            WHERE id = $1
-            """,
-            item_id,
-        )
+        await ensure_table_exists(conn)
+        row = await conn.fetchrow(GET_ITEM_QUERY, item_id)
 
     if row is None:
         raise HTTPException(status_code=404, detail=f"Item {item_id} not found")
 
-    return Item(**dict(row))
+    return json_response(Item, _item_from_row(row))
 
 
 @router.put("/{item_id}", response_model=Item)
-async def update_item(item_id: int, item: ItemUpdate) -> Item:
+async def update_item(item_id: int, item: ItemUpdate) -> Response:
     """Update an existing item."""
-    await ensure_table_exists()
-
-    # Build dynamic update query
-    update_fields = []
-    values = []
-    param_count = 1
-
-    if item.name is not None:
-        update_fields.append(f"name = ${param_count}")
-        values.append(item.name)
-        param_count += 1
-
-    if item.description is not None:
-        update_fields.append(f"description = ${param_count}")
-        values.append(item.description)
-        param_count += 1
-
-    if item.price is not None:
-        update_fields.append(f"price = ${param_count}")
-        values.append(item.price)
-        param_count += 1
-
-    if item.is_active is not None:
-        update_fields.append(f"is_active = ${param_count}")
-        values.append(item.is_active)
-        param_count += 1
-
-    if not update_fields:
+    if (
+        item.name is None
+        and item.description is None
+        and item.price is None
+        and item.is_active is None
+    ):
         raise HTTPException(status_code=400, detail="No fields to update")
 
-    update_fields.append(f"updated_at = ${param_count}")
-    values.append(datetime.now(UTC))
-    param_count += 1
-
-    values.append(item_id)
-
-    query = f"""
-        UPDATE items
-        SET {', '.join(update_fields)}
-        WHERE id = ${param_count}
-        RETURNING id, name, description, price, is_active, created_at, updated_at
-    """
-
     async with get_connection() as conn:
-        row = await conn.fetchrow(query, *values)
+        await ensure_table_exists(conn)
+        row = await conn.fetchrow(
+            UPDATE_ITEM_QUERY,
+            item.name,
+            item.description,
+            item.price,
+            item.is_active,
+            datetime.now(UTC),
+            item_id,
+        )
 
     if row is None:
         raise HTTPException(status_code=404, detail=f"Item {item_id} not found")
 
-    return Item(**dict(row))
+    return json_response(Item, _item_from_row(row))
 
 
 @router.delete("/{item_id}", status_code=204)
 async def delete_item(item_id: int) -> None:
     """Delete an item."""
-    await ensure_table_exists()
-
     async with get_connection() as conn:
+        await ensure_table_exists(conn)
         result = await conn.execute(
             "DELETE FROM items WHERE id = $1",
             item_id,
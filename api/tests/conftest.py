@@ -2,39 +2,91 @@
 Pytest configuration and fixtures.
 """
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from pytest_asyncio import is_async_test
 
 from app.main import app
+from app.routers import backups, health, items
 
+from .helpers import FakePool, make_conn_cm
 
-@pytest.fixture
+
+def pytest_collection_modifyitems(items):
+    """Run every async test in the session event loop the client lives in."""
+    session_loop = pytest.mark.asyncio(scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
 def anyio_backend():
     """Use asyncio as the async backend."""
     return "asyncio"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def client():
-    """Create an async test client."""
+    """
+    Create an async test client shared by the session (one per xdist worker).
+    ASGITransport calls the app in-process, so no sockets or server are involved.
+    """
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
 
+@pytest.fixture(scope="session", autouse=True)
+async def warm_routes(client):
+    """
+    Resolve the app's routes once before the first test.
+    FastAPI builds the route table of each included router on first lookup;
+    a request to an unmatched path walks every router without reaching a
+    handler, so nothing here touches the database.
+    """
+    await client.get("/__warmup__")
+
+
+@pytest.fixture(autouse=True)
+def reset_app_state():
+    """
+    Reset module-level caches and dependency overrides around each test.
+    The client is shared across the session, so state left in the app by one
+    test would otherwise leak into the next.
+    """
+    backups._cache = None
+    health._ready_cache = None
+    items._table_ready = False
+    yield
+    backups._cache = None
+    health._ready_cache = None
+    items._table_ready = False
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def patched_items_conn(monkeypatch):
+    """Mock connection handed to the items router by get_connection()."""
+    mock_conn = AsyncMock()
+    monkeypatch.setattr("app.routers.items.get_connection", make_conn_cm(mock_conn))
+    return mock_conn
+
+
 @pytest.fixture
-def mock_db_pool():
+def mock_db_pool(monkeypatch):
     """Mock database pool for tests that don't need real DB."""
-    with patch("app.db.connection._pool") as mock_pool:
-        mock_conn = AsyncMock()
-        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
-        yield mock_pool, mock_conn
+    mock_conn = AsyncMock()
+    mock_pool = FakePool(mock_conn)
+    monkeypatch.setattr("app.db.connection._pool", mock_pool)
+    return mock_pool, mock_conn
 
 
 @pytest.fixture
-def mock_pgbackrest():
+def mock_pgbackrest(monkeypatch):
     """Mock pgBackRest subprocess calls."""
-    with patch("subprocess.run") as mock_run:
-        yield mock_run
+    mock_exec = AsyncMock()
+    monkeypatch.setattr("asyncio.create_subprocess_exec", mock_exec)
+    return mock_exec
@@ -0,0 +1,30 @@
+"""
+Test doubles shared by the test modules.
+"""
+
+from contextlib import asynccontextmanager
+
+
+def make_conn_cm(mock_conn):
+    """Build a get_connection() replacement that yields mock_conn."""
+    @asynccontextmanager
+    async def _cm():
+        yield mock_conn
+
+    return _cm
+
+
+class FakePool:
+    """Minimal stand-in for asyncpg.Pool whose acquire() yields conn."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def acquire(self):
+        return self
+
+    async def __aenter__(self):
+        return self._conn
+
+    async def __aexit__(self, *exc_info):
+        return None
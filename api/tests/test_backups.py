@@ -3,13 +3,23 @@ Tests for backup status endpoint.
 """
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
+import orjson
 import pytest
 
 
+def make_process(returncode: int = 0, stdout: str = "", stderr: str = "") -> MagicMock:
+    """Build a fake asyncio subprocess with the given exit code and output."""
+    proc = MagicMock()
+    proc.returncode = returncode
+    proc.communicate = AsyncMock(return_value=(stdout.encode(), stderr.encode()))
+    proc.wait = AsyncMock(return_value=returncode)
+    return proc
+
+
 @pytest.mark.anyio
-async def test_backups_endpoint_success(client):
+async def test_backups_endpoint_success(client, mock_pgbackrest):
     """Test backup status endpoint with successful pgBackRest output."""
     mock_output = json.dumps([
         {
@@ -28,51 +38,60 @@ async def test_backups_endpoint_success(client):
         }
     ])
 
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stdout = mock_output
-    mock_result.stderr = ""
+    mock_pgbackrest.return_value = make_process(stdout=mock_output)
 
-    with patch("subprocess.run", return_value=mock_result):
-        response = await client.get("/backups")
-        assert response.status_code == 200
+    response = await client.get("/backups")
+    assert response.status_code == 200
 
-        data = response.json()
-        assert data["status"] == "ok"
-        assert len(data["backups"]) == 1
-        assert data["backups"][0]["type"] == "full"
-        assert data["wal_archive"] is not None
+    data = orjson.loads(response.content)
+    assert data["status"] == "ok"
+    assert len(data["backups"]) == 1
+    assert data["backups"][0]["type"] == "full"
+    assert data["wal_archive"] is not None
 
 
 @pytest.mark.anyio
-async def test_backups_endpoint_not_installed(client):
+async def test_backups_endpoint_not_installed(client, mock_pgbackrest):
     """Test backup status when pgBackRest is not installed."""
-    with patch("subprocess.run", side_effect=FileNotFoundError):
-        response = await client.get("/backups")
-        assert response.status_code == 200
+    mock_pgbackrest.side_effect = FileNotFoundError
+
+    response = await client.get("/backups")
+    assert response.status_code == 200
 
-        data = response.json()
-        assert data["status"] == "not_installed"
+    data = orjson.loads(response.content)
+    assert data["status"] == "not_installed"
 
 
 @pytest.mark.anyio
-async def test_backups_endpoint_error(client):
+async def test_backups_endpoint_error(client, mock_pgbackrest):
     """Test backup status when pgBackRest returns error."""
-    mock_result = MagicMock()
-    mock_result.returncode = 1
-    mock_result.stdout = ""
-    mock_result.stderr = "stanza not found"
+    mock_proc = make_process(returncode=1, stderr="stanza not found")
+    mock_pgbackrest.return_value = mock_proc
 
-    with patch("subprocess.run", return_value=mock_result):
-        response = await client.get("/backups")
-        assert response.status_code == 200
+    response = await client.get("/backups")
+    assert response.status_code == 200
 
-        data = response.json()
-        assert data["status"] == "unavailable"
+    data = orjson.loads(response.content)
+    assert data["status"] == "unavailable"
 
 
 @pytest.mark.anyio
-async def test_backups_endpoint_no_backups(client):
+async def test_backups_endpoint_timeout(client, mock_pgbackrest):
+    """Test backup status when pgBackRest does not finish in time."""
+    mock_proc = make_process()
+    mock_proc.communicate.side_effect = TimeoutError
+    mock_pgbackrest.return_value = mock_proc
+
+    response = await client.get("/backups")
+    assert response.status_code == 200
+
+    data = orjson.loads(response.content)
+    assert data["status"] == "timeout"
+    mock_proc.kill.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_backups_endpoint_no_backups(client, mock_pgbackrest):
     """Test backup status when no backups exist."""
     mock_output = json.dumps([
         {
@@ -82,15 +101,37 @@ async def test_backups_endpoint_no_backups(client):
         }
     ])
 
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stdout = mock_output
-    mock_result.stderr = ""
+    mock_pgbackrest.return_value = make_process(stdout=mock_output)
+
+    response = await client.get("/backups")
+    assert response.status_code == 200
+
+    data = orjson.loads(response.content)
+    assert data["status"] == "no_backup"
+    assert len(data["backups"]) == 0
+
+
+@pytest.mark.anyio
+async def test_backups_endpoint_cached(client, mock_pgbackrest):
+    """Test repeated requests reuse the cached pgBackRest result."""
+    mock_pgbackrest.return_value = make_process(stdout=json.dumps([]))
+
+    first = await client.get("/backups")
+    second = await client.get("/backups")
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert orjson.loads(second.content)["status"] == "no_stanza"
+    assert mock_pgbackrest.call_count == 1
+
+
+@pytest.mark.anyio
+async def test_backups_endpoint_parse_error(client, mock_pgbackrest):
+    """Test backup status when pgBackRest prints invalid JSON."""
+    mock_pgbackrest.return_value = make_process(stdout="not json")
 
-    with patch("subprocess.run", return_value=mock_result):
-        response = await client.get("/backups")
-        assert response.status_code == 200
+    response = await client.get("/backups")
+    assert response.status_code == 200
 
-        data = response.json()
-        assert data["status"] == "no_backup"
-        assert len(data["backups"]) == 0
+    data = orjson.loads(response.content)
+    assert data["status"] == "parse_error"
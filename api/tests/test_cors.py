@@ -0,0 +1,35 @@
+"""
+Tests for CORS middleware.
+"""
+
+import pytest
+
+
+@pytest.mark.anyio
+async def test_cors_headers_with_origin(client):
+    """Test cross-origin requests get CORS headers."""
+    response = await client.get("/health", headers={"Origin": "https://example.com"})
+    assert response.status_code == 200
+    assert "access-control-allow-origin" in response.headers
+
+
+@pytest.mark.anyio
+async def test_cors_preflight(client):
+    """Test preflight requests are answered by the middleware."""
+    response = await client.options(
+        "/items",
+        headers={
+            "Origin": "https://example.com",
+            "Access-Control-Request-Method": "POST",
+        },
+    )
+    assert response.status_code == 200
+    assert "access-control-allow-methods" in response.headers
+
+
+@pytest.mark.anyio
+async def test_no_cors_headers_without_origin(client):
+    """Test same-origin requests bypass CORS handling."""
+    response = await client.get("/health")
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
@@ -2,10 +2,23 @@
 Tests for health check endpoints.
 """
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
+import orjson
 import pytest
 
+from app.config import Settings
+from app.main import app
+from app.routers import health
+from app.routers.health import database_pool
+
+from .helpers import FakePool
+
+
+def _pool_factory(pool):
+    """Build a database_pool override that returns pool."""
+    return lambda: pool
+
 
 @pytest.mark.anyio
 async def test_health_endpoint(client):
@@ -13,10 +26,23 @@ async def test_health_endpoint(client):
     response = await client.get("/health")
     assert response.status_code == 200
 
-    data = response.json()
-    assert data["status"] == "healthy"
-    assert "version" in data
-    assert "timestamp" in data
+    data = orjson.loads(response.content)
+    assert {"status": "healthy"}.items() <= data.items()
+    assert {"version", "timestamp"} <= data.keys()
+
+
+@pytest.mark.anyio
+async def test_health_endpoint_version_with_percent(client, monkeypatch):
+    """Test the version is copied into the health body verbatim."""
+    monkeypatch.setattr(health, "get_settings", lambda: Settings(app_version="1.0-50%"))
+    health._health_prefix.cache_clear()
+    try:
+        response = await client.get("/health")
+    finally:
+        health._health_prefix.cache_clear()
+
+    assert response.status_code == 200
+    assert orjson.loads(response.content)["version"] == "1.0-50%"
 
 
 @pytest.mark.anyio
@@ -25,32 +51,75 @@ async def test_root_endpoint(client):
     response = await client.get("/")
     assert response.status_code == 200
 
-    data = response.json()
-    assert "message" in data
-    assert "docs" in data
-    assert "health" in data
+    assert {"message", "docs", "health"} <= orjson.loads(response.content).keys()
 
 
 @pytest.mark.anyio
 async def test_ready_endpoint_db_connected(client):
     """Test readiness endpoint when database is connected."""
-    mock_pool = AsyncMock()
     mock_conn = AsyncMock()
-    mock_conn.fetchval = AsyncMock(return_value=1)
-    mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+    mock_conn.fetchval.return_value = 1
+    app.dependency_overrides[database_pool] = _pool_factory(FakePool(mock_conn))
 
-    with patch("app.routers.health.get_pool", return_value=mock_pool):
-        response = await client.get("/ready")
-        assert response.status_code == 200
+    response = await client.get("/ready")
+    assert response.status_code == 200
 
-        data = response.json()
-        assert data["status"] == "ready"
-        assert data["database"] == "connected"
+    data = orjson.loads(response.content)
+    assert data["status"] == "ready"
+    assert data["database"] == "connected"
 
 
 @pytest.mark.anyio
 async def test_ready_endpoint_db_error(client):
     """Test readiness endpoint when database connection fails."""
-    with patch("app.routers.health.get_pool", side_effect=Exception("Connection failed")):
-        response = await client.get("/ready")
-        assert response.status_code == 503
+    mock_conn = AsyncMock()
+    mock_conn.fetchval.side_effect = Exception("Connection failed")
+    app.dependency_overrides[database_pool] = _pool_factory(FakePool(mock_conn))
+
+    response = await client.get("/ready")
+    assert response.status_code == 503
+
+
+@pytest.mark.anyio
+async def test_ready_endpoint_pool_unavailable(client, monkeypatch):
+    """Test readiness endpoint when the connection pool cannot be created."""
+    monkeypatch.setattr(
+        "app.routers.health.get_pool", AsyncMock(side_effect=Exception("Connection failed"))
+    )
+
+    response = await client.get("/ready")
+    assert response.status_code == 503
+
+    detail = orjson.loads(response.content)["detail"]
+    assert detail["status"] == "not_ready"
+    assert detail["database"] == "error: Connection failed"
+
+
+@pytest.mark.anyio
+async def test_ready_endpoint_cached(client, monkeypatch):
+    """Test a successful readiness check is reused within the TTL."""
+    mock_check = AsyncMock(return_value="connected")
+    app.dependency_overrides[database_pool] = _pool_factory(MagicMock())
+    monkeypatch.setattr("app.routers.health.check_database", mock_check)
+
+    first = await client.get("/ready")
+    second = await client.get("/ready")
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert mock_check.await_count == 1
+
+
+@pytest.mark.anyio
+async def test_ready_endpoint_failure_not_cached(client, monkeypatch):
+    """Test a failed readiness check is retried on the next probe."""
+    mock_check = AsyncMock(return_value="error: Connection failed")
+    app.dependency_overrides[database_pool] = _pool_factory(MagicMock())
+    monkeypatch.setattr("app.routers.health.check_database", mock_check)
+
+    first = await client.get("/ready")
+    second = await client.get("/ready")
+
+    assert first.status_code == 503
+    assert second.status_code == 503
+    assert mock_check.await_count == 2
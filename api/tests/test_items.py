@@ -3,108 +3,104 @@ Tests for items CRUD endpoints.
 """
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, patch
+from types import MappingProxyType
 
+import orjson
 import pytest
 
+# Fixed row timestamp; tests never depend on the current time
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
 
-@pytest.fixture
-def sample_item():
-    """Sample item data for testing."""
-    return {
-        "name": "Test Item",
-        "description": "A test item",
-        "price": 29.99,
-        "is_active": True,
-    }
+# Headers for requests that send pre-encoded JSON bodies
+JSON_HEADERS = {"content-type": "application/json"}
 
+# Sample item data for testing (read-only; copy with dict() to modify)
+SAMPLE_ITEM = MappingProxyType({
+    "name": "Test Item",
+    "description": "A test item",
+    "price": 29.99,
+    "is_active": True,
+})
 
-@pytest.fixture
-def mock_db_item():
-    """Mock database row for an item."""
-    return {
-        "id": 1,
-        "name": "Test Item",
-        "description": "A test item",
-        "price": 29.99,
-        "is_active": True,
-        "created_at": datetime.now(UTC),
-        "updated_at": datetime.now(UTC),
-    }
+# SAMPLE_ITEM encoded once as a JSON request body
+SAMPLE_ITEM_JSON = orjson.dumps(dict(SAMPLE_ITEM))
 
+# Mock database row for an item, with columns in SELECT order
+MOCK_DB_ITEM = (
+    1,  # id
+    "Test Item",  # name
+    "A test item",  # description
+    29.99,  # price
+    True,  # is_active
+    _FIXED_TS,  # created_at
+    _FIXED_TS,  # updated_at
+)
 
-@pytest.mark.anyio
-async def test_create_item(client, sample_item, mock_db_item):
-    """Test creating a new item."""
-    mock_conn = AsyncMock()
-    mock_conn.execute = AsyncMock()
-    mock_conn.fetchrow = AsyncMock(return_value=mock_db_item)
 
-    async def mock_get_connection():
-        class MockContext:
-            async def __aenter__(self):
-                return mock_conn
-            async def __aexit__(self, *args):
-                pass
-        return MockContext()
+# MOCK_DB_ITEM as returned by the API
+MOCK_ITEM_RESPONSE = MappingProxyType({
+    "id": 1,
+    **SAMPLE_ITEM,
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+})
 
-    with patch("app.routers.items.get_connection", mock_get_connection):
-        response = await client.post("/items", json=sample_item)
 
-        # Note: In real tests without mocking, this would return 201
-        # With our mock setup, we're testing the endpoint structure
-        assert response.status_code in [201, 500]  # 500 if mock not fully set up
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("method", "path", "body", "mock_attr", "mock_value", "expected_status", "expected_body"),
+    [
+        pytest.param(
+            "POST", "/items", SAMPLE_ITEM_JSON, "fetchrow", MOCK_DB_ITEM,
+            201, dict(MOCK_ITEM_RESPONSE), id="create",
+        ),
+        pytest.param("GET", "/items", None, "fetch", [], 200, [], id="list_empty"),
+        pytest.param(
+            "GET", "/items/999", None, "fetchrow", None,
+            404, {"detail": "Item 999 not found"}, id="get_not_found",
+        ),
+    ],
+)
+async def test_items_mocked_db(
+    client, patched_items_conn, method, path, body, mock_attr, mock_value,
+    expected_status, expected_body,
+):
+    """Test item endpoints against a mocked connection."""
+    getattr(patched_items_conn, mock_attr).return_value = mock_value
+
+    headers = JSON_HEADERS if body is not None else None
+    response = await client.request(method, path, content=body, headers=headers)
+    assert response.status_code == expected_status
+    assert orjson.loads(response.content) == expected_body
 
 
 @pytest.mark.anyio
 async def test_create_item_validation_error(client):
     """Test validation error when creating item with invalid data."""
-    invalid_item = {
+    invalid_item = orjson.dumps({
         "name": "",  # Empty name should fail
         "price": -10,  # Negative price should fail
-    }
+    })
 
-    response = await client.post("/items", json=invalid_item)
+    response = await client.post("/items", content=invalid_item, headers=JSON_HEADERS)
     assert response.status_code == 422  # Validation error
 
 
 @pytest.mark.anyio
-async def test_list_items_empty(client):
-    """Test listing items when database is empty."""
-    mock_conn = AsyncMock()
-    mock_conn.execute = AsyncMock()
-    mock_conn.fetch = AsyncMock(return_value=[])
-
-    async def mock_get_connection():
-        class MockContext:
-            async def __aenter__(self):
-                return mock_conn
-            async def __aexit__(self, *args):
-                pass
-        return MockContext()
-
-    with patch("app.routers.items.get_connection", mock_get_connection):
-        response = await client.get("/items")
+async def test_create_items_bulk(client, patched_items_conn):
+    """Test bulk creation copies all rows in one call."""
+    body = b"[" + SAMPLE_ITEM_JSON + b"," + SAMPLE_ITEM_JSON + b"]"
+    response = await client.post("/items/bulk", content=body, headers=JSON_HEADERS)
+    assert response.status_code == 201
+    assert orjson.loads(response.content) == {"inserted": 2}
 
-        # Should return 200 with empty list
-        assert response.status_code in [200, 500]
+    copy = patched_items_conn.copy_records_to_table
+    copy.assert_awaited_once()
+    assert len(copy.call_args.kwargs["records"]) == 2
 
 
 @pytest.mark.anyio
-async def test_get_item_not_found(client):
-    """Test getting a non-existent item returns 404."""
-    mock_conn = AsyncMock()
-    mock_conn.execute = AsyncMock()
-    mock_conn.fetchrow = AsyncMock(return_value=None)
-
-    async def mock_get_connection():
-        class MockContext:
-            async def __aenter__(self):
-                return mock_conn
-            async def __aexit__(self, *args):
-                pass
-        return MockContext()
-
-    with patch("app.routers.items.get_connection", mock_get_connection):
-        response = await client.get("/items/999")
-        assert response.status_code in [404, 500]
+async def test_create_items_bulk_empty(client):
+    """Test bulk creation rejects an empty list."""
+    response = await client.post("/items/bulk", content=b"[]", headers=JSON_HEADERS)
+    assert response.status_code == 422